@@ -1,13 +1,32 @@
 """
 Step executor with retry logic and timeout handling.
 
-Executes individual steps with exponential backoff and validation.
+Executes individual steps with capped, jittered exponential backoff and validation.
 """
 
 from typing import Any, Optional, Callable, Dict
 import asyncio
+import random
+import sys
 import time
 
+# asyncio.timeout (3.11+) avoids the extra Task that wait_for wraps around the call
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
+
+def backoff_delay(attempt: int, max_backoff: float) -> float:
+    """
+    Delay before retrying after a failed attempt.
+    
+    Doubles per attempt up to max_backoff, with jitter so steps failing
+    together don't retry in lockstep.
+    
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        max_backoff: Upper bound on the delay in seconds
+    """
+    return min(max_backoff, 2 ** attempt) * (0.5 + random.random() * 0.5)
+
 
 class StepExecutor:
     """
@@ -16,16 +35,23 @@ class StepExecutor:
     Supports parallel execution and result validation.
     """
     
-    def __init__(self, max_retries: int = 3, base_timeout: float = 30.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_timeout: float = 30.0,
+        max_backoff: float = 30.0
+    ):
         """
         Initialize step executor.
         
         Args:
             max_retries: Maximum retry attempts
             base_timeout: Base timeout in seconds
+            max_backoff: Upper bound on the delay between attempts in seconds
         """
         self.max_retries = max_retries
         self.base_timeout = base_timeout
+        self.max_backoff = max_backoff
         self.execution_metrics: Dict[str, Dict[str, Any]] = {}
     
     async def execute(
@@ -45,42 +71,43 @@ class StepExecutor:
         Returns:
             Result or None if all retries exhausted
         """
-        self.execution_metrics[step_name] = {
+        metrics = {
             "attempts": 0,
             "start_time": time.time(),
             "success": False
         }
+        self.execution_metrics[step_name] = metrics
+        max_retries = self.max_retries
+        base_timeout = self.base_timeout
+        max_backoff = self.max_backoff
         
-        for attempt in range(self.max_retries):
-            self.execution_metrics[step_name]["attempts"] = attempt + 1
+        for attempt in range(max_retries):
+            metrics["attempts"] = attempt + 1
             
             try:
                 # Execute with timeout
-                result = await asyncio.wait_for(
-                    task(),
-                    timeout=self.base_timeout
-                )
+                if _HAS_ASYNCIO_TIMEOUT:
+                    async with asyncio.timeout(base_timeout):
+                        result = await task()
+                else:
+                    result = await asyncio.wait_for(
+                        task(),
+                        timeout=base_timeout
+                    )
                 
                 # Validate result if validator provided
                 if validate and not validate(result):
                     raise ValueError("Result validation failed")
                 
-                self.execution_metrics[step_name]["success"] = True
-                self.execution_metrics[step_name]["duration"] = (
-                    time.time() - self.execution_metrics[step_name]["start_time"]
-                )
+                metrics["success"] = True
+                metrics["duration"] = time.time() - metrics["start_time"]
                 
                 return result
             
-            except asyncio.TimeoutError:
-                if attempt < self.max_retries - 1:
-                    backoff = 2 ** attempt
-                    await asyncio.sleep(backoff)
             except Exception as e:
-                if attempt < self.max_retries - 1:
-                    backoff = 2 ** attempt
-                    await asyncio.sleep(backoff)
-                else:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(backoff_delay(attempt, max_backoff))
+                elif not isinstance(e, asyncio.TimeoutError):
                     raise
         
         return None
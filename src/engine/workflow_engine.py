@@ -4,27 +4,157 @@ Workflow engine with DAG-based execution and state persistence.
 Manages dependency resolution and async execution of workflow steps.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, NamedTuple, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import chain
 import asyncio
+import heapq
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import time
+import uuid
 
+from engine.step_executor import backoff_delay
+from healing.error_analyzer import ErrorAnalyzer
+from healing.recovery_planner import RecoveryPlanner, RecoveryStrategy
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
 class StepDefinition:
     """Definition for a workflow step."""
     name: str
-    depends_on: List[str] = field(default_factory=list)
+    depends_on: Tuple[str, ...] = ()
     timeout: float = 30.0
     retries: int = 3
+    expected_cost: float = 1.0
+    selectivity: float = 1.0
+    kind: str = "io"
+    
+    def __post_init__(self):
+        # Stored as a tuple so the dependency list can't change after compile
+        object.__setattr__(self, "depends_on", tuple(self.depends_on))
+
 
+class StepOutcome(NamedTuple):
+    """Outcome of a single step within an execution."""
+    status: str
+    value: Any = None
+    error: Optional[str] = None
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
+class _CompiledPlan:
+    """Scheduling data derived once from a workflow definition."""
+    topo_order: List[List[str]]
+    rank: Dict[str, int]
+    in_degree: Dict[str, int]
+    successors: Dict[str, List[str]]
+    steps_by_name: Dict[str, StepDefinition]
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowDefinition:
     """Definition for a complete workflow."""
     name: str
-    steps: List[StepDefinition]
+    steps: Tuple[StepDefinition, ...]
     description: Optional[str] = None
+    _compiled: Optional[_CompiledPlan] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Stored as a tuple so the step list can't change after compile
+        object.__setattr__(self, "steps", tuple(self.steps))
+
+
+class _Lane:
+    """
+    Shared dispatcher for short synchronous steps.
+    
+    Steps queued while the dispatcher is busy are drained on a single event
+    loop wakeup, and each is handed to the thread pool as its own job so a
+    slow step doesn't hold up the rest of its batch. Every step resolves its
+    own future.
+    """
+    
+    def __init__(self, run: Callable[[StepDefinition], Any]):
+        """
+        Initialize lane and start its worker on the running event loop.
+        
+        Args:
+            run: Synchronous function executing one step
+        """
+        self._run = run
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._drain())
+    
+    def is_usable(self) -> bool:
+        """Check the worker is alive on the currently running loop."""
+        return (
+            not self._worker.done()
+            and self._worker.get_loop() is asyncio.get_running_loop()
+        )
+    
+    def submit(self, step: StepDefinition) -> asyncio.Future:
+        """Queue a step and return a future for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((step, future))
+        return future
+    
+    def close(self) -> None:
+        """Stop the worker; steps still queued are cancelled."""
+        if self._worker.get_loop().is_closed():
+            return
+        self._worker.cancel()
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+    
+    async def _drain(self) -> None:
+        """Dispatch queued steps to the thread pool in batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            for step, future in batch:
+                if future.done():
+                    continue  # Cancelled while queued
+                job = loop.run_in_executor(None, self._run, step)
+                job.add_done_callback(partial(_transfer_outcome, future))
+                # A step that times out frees its pool slot if not yet started
+                future.add_done_callback(partial(_cancel_if_cancelled, job))
+
+
+def _transfer_outcome(future: asyncio.Future, job: asyncio.Future) -> None:
+    """Copy a finished executor job's outcome onto the step's future."""
+    if future.done():
+        return
+    if job.cancelled():
+        future.cancel()
+        return
+    error = job.exception()
+    if error is None:
+        future.set_result(job.result())
+    elif isinstance(error, Exception):
+        future.set_exception(error)
+    else:
+        future.set_exception(RuntimeError(f"Lane step aborted: {error!r}"))
+
+
+def _cancel_if_cancelled(job: asyncio.Future, future: asyncio.Future) -> None:
+    """Cancel an executor job once its step's future is cancelled."""
+    if future.cancelled():
+        job.cancel()
 
 
 class WorkflowEngine:
@@ -34,39 +164,127 @@ class WorkflowEngine:
     Manages dependency resolution and async execution with resumability.
     """
     
-    def __init__(self):
-        """Initialize workflow engine."""
+    def __init__(
+        self,
+        state_dir: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_backoff: float = 30.0
+    ):
+        """
+        Initialize workflow engine.
+        
+        Args:
+            state_dir: Optional directory where each execution's state is
+                persisted as <execution_id>.json
+            checkpoint_path: Optional SQLite database for step checkpoints
+            max_concurrency: Optional cap on steps running at once; ready
+                steps beyond it wait, most expensive first
+            max_backoff: Upper bound on the delay before a step is retried
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_backoff = max_backoff
         self.workflows: Dict[str, WorkflowDefinition] = {}
         self.execution_state: Dict[str, Dict[str, Any]] = {}
+        self.state_dir = state_dir
+        if state_dir is not None:
+            os.makedirs(state_dir, exist_ok=True)
+        
+        # Background writer, started lazily on first execute
+        self._persist_queue: Optional[asyncio.Queue] = None
+        self._persist_task: Optional[asyncio.Task] = None
+        
+        # Batching worker for "cpu" steps, started lazily on first use
+        self._lane: Optional[_Lane] = None
+        
+        # Decide whether a failed step's descendants should still run
+        self.error_analyzer = ErrorAnalyzer()
+        self.recovery_planner = RecoveryPlanner()
+        
+        self._ckpt_conn: Optional[sqlite3.Connection] = None
+        if checkpoint_path is not None:
+            self._ckpt_conn = sqlite3.connect(checkpoint_path, isolation_level=None)
+            self._ckpt_conn.execute("PRAGMA journal_mode=WAL")
+            self._ckpt_conn.execute("PRAGMA synchronous=NORMAL")
+            self._ckpt_conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "execution_id TEXT, step TEXT, result BLOB, "
+                "PRIMARY KEY (execution_id, step))"
+            )
     
     def register_workflow(self, workflow: WorkflowDefinition) -> None:
         """Register a workflow definition."""
+        # Definitions are frozen with tuple fields, so the plan can't go stale
+        object.__setattr__(workflow, "_compiled", self._compile(workflow))
         self.workflows[workflow.name] = workflow
     
     def _get_execution_order(
         self,
-        workflow: WorkflowDefinition
+        in_degree: Dict[str, int],
+        successors: Dict[str, List[str]]
     ) -> List[List[str]]:
         """Get execution order respecting dependencies."""
-        completed = set()
+        in_deg = dict(in_degree)
+        ready = deque(name for name, d in in_deg.items() if d == 0)
         order = []
         
-        while len(completed) < len(workflow.steps):
-            current_level = []
-            
-            for step in workflow.steps:
-                if step.name not in completed:
-                    if all(dep in completed for dep in step.depends_on):
-                        current_level.append(step.name)
-            
-            if not current_level:
-                raise ValueError("Circular dependency detected")
-            
+        while ready:
+            current_level = [ready.popleft() for _ in range(len(ready))]
+            for name in current_level:
+                for child in successors.get(name, ()):
+                    in_deg[child] -= 1
+                    if in_deg[child] == 0:
+                        ready.append(child)
             order.append(current_level)
-            completed.update(current_level)
+        
+        if sum(in_deg.values()) > 0:
+            raise ValueError("Circular dependency detected")
         
         return order
     
+    def _compile(self, workflow: WorkflowDefinition) -> _CompiledPlan:
+        """
+        Build dependency maps and a cost-ordered plan for a workflow.
+        
+        Each level of the topological order is sorted by descending cost, and
+        rank orders all steps by cost alone, ties kept in topological order.
+        Only ready steps are ranked against each other, so when
+        max_concurrency holds some back the most expensive one is launched
+        first (longest processing time first). Without a limit every ready
+        step starts at once and rank only fixes the launch order.
+        """
+        in_degree: Dict[str, int] = {}
+        successors: Dict[str, List[str]] = {}
+        for step in workflow.steps:
+            in_degree[step.name] = len(step.depends_on)
+            successors.setdefault(step.name, [])
+            for dep in step.depends_on:
+                successors.setdefault(dep, []).append(step.name)
+        
+        priority = {
+            step.name: step.expected_cost * step.selectivity
+            for step in workflow.steps
+        }
+        topo_order = self._get_execution_order(in_degree, successors)
+        for level in topo_order:
+            level.sort(key=priority.__getitem__, reverse=True)
+        # Stable sort keeps topological order among equally costly steps
+        by_cost = sorted(
+            chain.from_iterable(topo_order),
+            key=priority.__getitem__,
+            reverse=True
+        )
+        
+        return _CompiledPlan(
+            topo_order=topo_order,
+            rank={name: i for i, name in enumerate(by_cost)},
+            in_degree=in_degree,
+            successors=successors,
+            steps_by_name={step.name: step for step in workflow.steps}
+        )
+    
     async def execute(
         self,
         workflow: WorkflowDefinition,
@@ -77,47 +295,371 @@ class WorkflowEngine:
         
         Args:
             workflow: Workflow to execute
-            resume_from: Step to resume from (for resumability)
+            resume_from: Execution ID to resume; steps that completed in
+                that execution are not run again
             
         Returns:
             Execution results
         """
-        execution_id = f"{workflow.name}_{int(datetime.now().timestamp() * 1000)}"
-        self.execution_state[execution_id] = {
+        self._ensure_persist_task()
+        
+        if resume_from is not None:
+            execution_id = resume_from
+            completed = self._load_checkpoint(execution_id)
+            self.execution_state.pop(execution_id, None)
+        else:
+            # Wall-clock time keeps ids ordered; the uuid suffix keeps them
+            # unique across processes and restarts sharing a checkpoint db
+            execution_id = f"{workflow.name}_{time.time_ns()}_{uuid.uuid4().hex[:12]}"
+            completed = {}
+        
+        self._update_state(execution_id, {
             "workflow": workflow.name,
             "status": "running",
-            "results": {},
-            "started_at": datetime.now().isoformat()
-        }
-        
-        execution_order = self._get_execution_order(workflow)
+            "steps": {
+                name: StepOutcome("success", result)
+                for name, result in completed.items()
+            },
+            "started_at_ns": time.time_ns()
+        })
         
+        pending: Set[asyncio.Task] = set()
         try:
-            for level in execution_order:
-                # Execute all steps at this level in parallel
-                tasks = []
-                for step_name in level:
-                    step = next(s for s in workflow.steps if s.name == step_name)
-                    tasks.append(self._execute_step(step, execution_id))
+            compiled = workflow._compiled
+            if compiled is None:
+                compiled = self._compile(workflow)
+            in_degree = dict(compiled.in_degree)
+            successors = compiled.successors
+            steps_by_name = compiled.steps_by_name
+            rank = compiled.rank
+            
+            # Steps restored from a checkpoint count as finished
+            finished = 0
+            for step_name in completed:
+                if step_name not in in_degree:
+                    continue
+                finished += 1
+                for child in successors[step_name]:
+                    in_degree[child] -= 1
+            
+            # Start steps whose dependencies are satisfied, and schedule
+            # successors as soon as their last dependency finishes. Ready
+            # steps are launched most expensive first, up to max_concurrency.
+            ready = [
+                (rank[step.name], step.name)
+                for step in workflow.steps
+                if in_degree[step.name] == 0 and step.name not in completed
+            ]
+            heapq.heapify(ready)
+            skipped: Set[str] = set()
+            attempts: Dict[str, int] = {}
+            
+            limit = self.max_concurrency
+            while ready or pending:
+                while ready and (limit is None or len(pending) < limit):
+                    _, name = heapq.heappop(ready)
+                    pending.add(self._schedule_step(steps_by_name[name], execution_id))
                 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
                 
-                for step_name, result in zip(level, results):
-                    if isinstance(result, Exception):
-                        self.execution_state[execution_id][step_name] = {
-                            "status": "failed",
-                            "error": str(result)
-                        }
+                # Record each step as soon as it finishes rather than
+                # waiting on its siblings
+                checkpoint = {}
+                for task in done:
+                    step_name = task.step_name
+                    attempts[step_name] = attempts.get(step_name, 0) + 1
+                    # A step whose body raised CancelledError ends cancelled,
+                    # and task.exception() would re-raise it here
+                    if task.cancelled():
+                        outcome = StepOutcome("cancelled", error="Step was cancelled")
+                    elif task.exception() is None:
+                        outcome = StepOutcome("success", task.result())
                     else:
-                        self.execution_state[execution_id]["results"][step_name] = result
+                        error = task.exception()
+                        step = steps_by_name[step_name]
+                        outcome = self._recover(step, error, attempts[step_name])
+                        if outcome is None:
+                            # Successors stay held until the retry settles
+                            self._update_state(execution_id, {
+                                "steps": {
+                                    step_name: StepOutcome("retrying", error=str(error))
+                                }
+                            })
+                            # The retry keeps the failed run's slot while it
+                            # backs off, rather than rejoining the ready heap
+                            pending.add(self._schedule_step(
+                                step,
+                                execution_id,
+                                delay=self._retry_delay(attempts[step_name])
+                            ))
+                            continue
+                    
+                    finished += 1
+                    if outcome.status == "success":
+                        checkpoint[step_name] = outcome.value
+                    self._update_state(execution_id, {"steps": {step_name: outcome}})
+                    
+                    # Nothing downstream of a failed step has its inputs
+                    if outcome.status != "success":
+                        doomed = self._get_descendants(step_name, successors)
+                        doomed -= skipped
+                        doomed.difference_update(completed)
+                        skipped |= doomed
+                        finished += len(doomed)
+                        self._update_state(execution_id, {
+                            "steps": {name: StepOutcome("skipped") for name in doomed}
+                        })
+                    
+                    for child in successors[step_name]:
+                        in_degree[child] -= 1
+                        if (
+                            in_degree[child] == 0
+                            and child not in completed
+                            and child not in skipped
+                        ):
+                            heapq.heappush(ready, (rank[child], child))
+                
+                if checkpoint:
+                    self._save_checkpoint(execution_id, checkpoint)
+            
+            if finished < len(workflow.steps):
+                raise ValueError("Circular dependency detected")
             
-            self.execution_state[execution_id]["status"] = "completed"
+            self._update_state(execution_id, {"status": "completed"})
         except Exception as e:
-            self.execution_state[execution_id]["status"] = "failed"
-            self.execution_state[execution_id]["error"] = str(e)
+            self._update_state(execution_id, {"status": "failed", "error": str(e)})
+        finally:
+            # Don't leave steps running if execution is cancelled or errors out
+            for task in pending:
+                task.cancel()
+            if self.execution_state[execution_id]["status"] == "running":
+                self._update_state(execution_id, {
+                    "status": "cancelled",
+                    "error": "Execution was cancelled"
+                })
+            self._update_state(execution_id, {"completed_at_ns": time.time_ns()})
         
-        self.execution_state[execution_id]["completed_at"] = datetime.now().isoformat()
-        return self.execution_state[execution_id]
+        # Make sure the final state has reached disk before returning
+        if self._persist_queue is not None:
+            await self._persist_queue.join()
+        
+        return self.get_execution_status(execution_id)
+    
+    def _recover(
+        self,
+        step: StepDefinition,
+        error: BaseException,
+        attempt: int
+    ) -> Optional[StepOutcome]:
+        """
+        Apply the recovery plan for a failed step.
+        
+        Args:
+            step: The failed step
+            error: Exception raised by the step
+            attempt: Number of times the step has run so far
+            
+        Returns:
+            None if the step should run again, otherwise its final outcome
+        """
+        step_name = step.name
+        analysis = self.error_analyzer.analyze(error)
+        plan = self.recovery_planner.plan_recovery(step_name, analysis.category.value)
+        
+        # The step's own retry budget caps whatever the plan allows
+        if (
+            plan.strategy == RecoveryStrategy.RETRY
+            and attempt < min(step.retries, plan.max_attempts)
+        ):
+            return None
+        
+        if (
+            plan.strategy in (RecoveryStrategy.RETRY, RecoveryStrategy.FALLBACK)
+            and step_name in self.recovery_planner.fallback_tasks
+        ):
+            try:
+                return StepOutcome(
+                    "success", self.recovery_planner.execute_fallback(step_name)
+                )
+            except Exception as e:
+                return StepOutcome("failed", error=str(e))
+        
+        return StepOutcome("failed", error=str(error))
+    
+    def _get_descendants(
+        self,
+        step_name: str,
+        successors: Dict[str, List[str]]
+    ) -> Set[str]:
+        """Get every step that transitively depends on a step."""
+        descendants: Set[str] = set()
+        queue = deque(successors.get(step_name, ()))
+        while queue:
+            name = queue.popleft()
+            if name not in descendants:
+                descendants.add(name)
+                queue.extend(successors.get(name, ()))
+        return descendants
+    
+    def _save_checkpoint(self, execution_id: str, results: Dict[str, Any]) -> None:
+        """Checkpoint a batch of completed step results in one statement."""
+        if self._ckpt_conn is None:
+            return
+        
+        rows = []
+        for step_name, result in results.items():
+            try:
+                rows.append((execution_id, step_name, pickle.dumps(result)))
+            except Exception:
+                # The step still succeeded; it just reruns on resume
+                logger.exception(
+                    "Cannot checkpoint result of step %s in %s",
+                    step_name,
+                    execution_id
+                )
+        
+        if rows:
+            self._ckpt_conn.executemany(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                rows
+            )
+    
+    def _load_checkpoint(self, execution_id: str) -> Dict[str, Any]:
+        """
+        Load completed step results for an execution.
+        
+        Falls back to in-memory results when no checkpoint database is set.
+        """
+        if self._ckpt_conn is None:
+            state = self.execution_state.get(execution_id, {})
+            return {
+                name: outcome.value
+                for name, outcome in state.get("steps", {}).items()
+                if outcome.status == "success"
+            }
+        
+        rows = self._ckpt_conn.execute(
+            "SELECT step, result FROM checkpoints WHERE execution_id = ?",
+            (execution_id,)
+        )
+        return {step: pickle.loads(result) for step, result in rows}
+    
+    def _update_state(self, execution_id: str, patch: Dict[str, Any]) -> None:
+        """
+        Apply a patch to execution state and queue it for persistence.
+        
+        Nested dicts in the patch are merged one level deep, so
+        {"steps": {step: outcome}} records a single step outcome.
+        """
+        state = self.execution_state.setdefault(execution_id, {})
+        for key, value in patch.items():
+            if isinstance(value, dict) and isinstance(state.get(key), dict):
+                state[key].update(value)
+            else:
+                state[key] = value
+        
+        if self._persist_queue is not None:
+            self._persist_queue.put_nowait(execution_id)
+    
+    def _ensure_persist_task(self) -> None:
+        """Start the background state writer on the running event loop."""
+        if self.state_dir is None:
+            return
+        if self._persist_task is not None and not self._persist_task.done():
+            if self._persist_task.get_loop() is asyncio.get_running_loop():
+                return
+        
+        self._persist_queue = asyncio.Queue()
+        self._persist_task = asyncio.create_task(self._persist_loop())
+    
+    async def _persist_loop(self) -> None:
+        """Coalesce queued updates into one write per touched execution."""
+        queue = self._persist_queue
+        while True:
+            execution_ids = {await queue.get()}
+            batch = 1
+            while not queue.empty():
+                execution_ids.add(queue.get_nowait())
+                batch += 1
+            
+            try:
+                payloads = {
+                    execution_id: self._serialize_state(
+                        execution_id, self.execution_state[execution_id]
+                    )
+                    for execution_id in execution_ids
+                }
+                await asyncio.to_thread(self._write_states, payloads)
+            except Exception:
+                logger.exception("Failed to persist execution state")
+            finally:
+                for _ in range(batch):
+                    queue.task_done()
+    
+    def _serialize_state(self, execution_id: str, state: Dict[str, Any]) -> str:
+        """Serialize one execution's state in the ExecutionResultModel layout."""
+        payload = _with_iso_timestamps(state)
+        payload["execution_id"] = execution_id
+        payload["workflow_name"] = state["workflow"]
+        payload["steps"] = {
+            name: outcome._asdict()
+            for name, outcome in state.get("steps", {}).items()
+        }
+        return json.dumps(payload, default=str)
+    
+    def _write_states(self, payloads: Dict[str, str]) -> None:
+        """Atomically replace each execution's state file."""
+        for execution_id, payload in payloads.items():
+            path = os.path.join(self.state_dir, f"{execution_id}.json")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+    
+    async def aclose(self) -> None:
+        """Flush pending state writes, stop the writer and close the engine."""
+        task = self._persist_task
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            await self._persist_queue.join()
+        self.close()
+    
+    def _schedule_step(
+        self,
+        step: StepDefinition,
+        execution_id: str,
+        delay: float = 0.0
+    ) -> asyncio.Task:
+        """Start a step, optionally after a delay, as a task tagged with its name."""
+        if delay > 0:
+            coro = self._execute_step_after(delay, step, execution_id)
+        else:
+            coro = self._execute_step(step, execution_id)
+        task = asyncio.create_task(coro)
+        task.step_name = step.name
+        return task
+    
+    async def _execute_step_after(
+        self,
+        delay: float,
+        step: StepDefinition,
+        execution_id: str
+    ) -> Any:
+        """Wait out a retry backoff, then execute the step."""
+        await asyncio.sleep(delay)
+        return await self._execute_step(step, execution_id)
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff before rerunning a step that has failed attempt times."""
+        return backoff_delay(attempt - 1, self.max_backoff)
     
     async def _execute_step(
         self,
@@ -125,15 +667,68 @@ class WorkflowEngine:
         execution_id: str
     ) -> Any:
         """Execute a single workflow step."""
+        if step.kind == "cpu":
+            if self._lane is None or not self._lane.is_usable():
+                self._lane = _Lane(self._run_step_sync)
+            # The thread can't be interrupted; on timeout the step is
+            # abandoned and its result dropped
+            return await asyncio.wait_for(self._lane.submit(step), step.timeout)
+        
         try:
             await asyncio.sleep(0.1)  # Simulate work
             return {"step": step.name, "status": "success"}
         except asyncio.TimeoutError:
             raise Exception(f"Step {step.name} timed out")
     
+    def _run_step_sync(self, step: StepDefinition) -> Any:
+        """Execute a synchronous step on the lane worker."""
+        return {"step": step.name, "status": "success"}
+    
+    def close(self) -> None:
+        """Stop the state writer and lane and close the checkpoint database."""
+        if self._persist_task is not None:
+            self._persist_task.cancel()
+            self._persist_task = None
+            self._persist_queue = None
+        
+        if self._lane is not None:
+            self._lane.close()
+            self._lane = None
+        
+        if self._ckpt_conn is not None:
+            self._ckpt_conn.close()
+            self._ckpt_conn = None
+    
     def get_execution_status(self, execution_id: str) -> Dict[str, Any]:
-        """Get execution status."""
-        return self.execution_state.get(execution_id)
+        """Get execution status with timestamps formatted as ISO 8601."""
+        state = self.execution_state.get(execution_id)
+        if state is None:
+            return None
+        
+        return _with_iso_timestamps(state)
+
+
+@lru_cache(maxsize=128)
+def _format_seconds(seconds: int) -> str:
+    """Format whole UTC seconds, cached since many timestamps share a second."""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _format_timestamp_ns(ns: int) -> str:
+    """Format a time.time_ns() value as an ISO 8601 UTC timestamp."""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{_format_seconds(seconds)}.{remainder // 1000:06d}+00:00"
+
+
+def _with_iso_timestamps(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an execution state, adding ISO 8601 forms of its timestamps."""
+    result = dict(state)
+    for key in ("started_at", "completed_at"):
+        ns = state.get(f"{key}_ns")
+        if ns is not None:
+            result[key] = _format_timestamp_ns(ns)
+    return result
+
 
 # Additional utility functions
 def validate_workflow_dag(steps):
@@ -4,9 +4,18 @@ Error analyzer using LLM to classify errors and identify root causes.
 Provides error categorization and recovery recommendations.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass
+from types import MappingProxyType
+import asyncio
+import bisect
+import re
+
+
+# Confidence by message length: <= 20 chars, <= 50 chars, longer
+_CONFIDENCE_THRESHOLDS = (20, 50)
+_CONFIDENCES = (0.5, 0.7, 0.9)
 
 
 class ErrorCategory(Enum):
@@ -18,7 +27,7 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorAnalysis:
     """Result of error analysis."""
     category: ErrorCategory
@@ -34,14 +43,68 @@ class ErrorAnalyzer:
     Classifies errors and suggests recovery strategies.
     """
     
+    _RECOMMENDATIONS: Dict[ErrorCategory, Tuple[str, ...]] = {
+        ErrorCategory.TIMEOUT: (
+            "Increase timeout threshold",
+            "Optimize step performance",
+            "Split into smaller steps"
+        ),
+        ErrorCategory.RESOURCE_EXHAUSTED: (
+            "Increase resource allocation",
+            "Implement rate limiting",
+            "Add step batching"
+        ),
+        ErrorCategory.INVALID_INPUT: (
+            "Validate input data",
+            "Add data transformation",
+            "Check upstream step output"
+        ),
+        ErrorCategory.EXTERNAL_SERVICE: (
+            "Check service status",
+            "Implement circuit breaker",
+            "Add exponential backoff"
+        ),
+    }
+    _DEFAULT_RECOMMENDATIONS: Tuple[str, ...] = ("Retry with backoff",)
+    _CATEGORY_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize error analyzer."""
-        self.error_patterns: Dict[str, ErrorCategory] = {
+        # Retry loops tend to analyze the same message repeatedly
+        self._category_cache: Dict[str, ErrorCategory] = {}
+        self.error_patterns = {
             "timeout": ErrorCategory.TIMEOUT,
             "Resource": ErrorCategory.RESOURCE_EXHAUSTED,
             "Invalid": ErrorCategory.INVALID_INPUT,
             "Connection": ErrorCategory.EXTERNAL_SERVICE,
         }
+        
+        # Exception types that identify their category without the message
+        self._type_map: Dict[type, ErrorCategory] = {
+            # Distinct classes before Python 3.11
+            asyncio.TimeoutError: ErrorCategory.TIMEOUT,
+            TimeoutError: ErrorCategory.TIMEOUT,
+            ConnectionError: ErrorCategory.EXTERNAL_SERVICE,
+            MemoryError: ErrorCategory.RESOURCE_EXHAUSTED,
+            ValueError: ErrorCategory.INVALID_INPUT,
+        }
+        self._type_cache: Dict[type, Optional[ErrorCategory]] = {}
+    
+    @property
+    def error_patterns(self) -> Mapping[str, ErrorCategory]:
+        """Message patterns in priority order; assign a new dict to change them."""
+        return self._error_patterns
+    
+    @error_patterns.setter
+    def error_patterns(self, patterns: Dict[str, ErrorCategory]) -> None:
+        # Read-only view so edits go through here and rebuild the matcher
+        self._error_patterns = MappingProxyType(dict(patterns))
+        # Single alternation scanned in C instead of one substring test per pattern
+        self._pattern_regex = re.compile(
+            "|".join(re.escape(p) for p in self._error_patterns)
+        )
+        self._pattern_rank = {p: i for i, p in enumerate(self._error_patterns)}
+        self._category_cache.clear()
     
     def analyze(self, error: Exception, context: Optional[Dict[str, Any]] = None) -> ErrorAnalysis:
         """
@@ -54,14 +117,20 @@ class ErrorAnalyzer:
         Returns:
             ErrorAnalysis with category and recommendations
         """
+        # Known exception types skip building and scanning the message
+        category = self._match_type(type(error))
+        if category is not None:
+            return ErrorAnalysis(
+                category=category,
+                root_cause=type(error).__name__,
+                confidence=0.95,
+                recommendations=self._get_recommendations(category)
+            )
+        
         error_str = str(error)
         
         # Pattern matching for categorization
-        category = ErrorCategory.UNKNOWN
-        for pattern, cat in self.error_patterns.items():
-            if pattern in error_str:
-                category = cat
-                break
+        category = self._match_category(error_str)
         
         # Generate recommendations based on category
         recommendations = self._get_recommendations(category)
@@ -73,37 +142,48 @@ class ErrorAnalyzer:
             recommendations=recommendations
         )
     
+    def _match_type(self, error_type: type) -> Optional[ErrorCategory]:
+        """Match an exception type against known types, cached per type."""
+        try:
+            return self._type_cache[error_type]
+        except KeyError:
+            pass
+        
+        category = None
+        for known_type, cat in self._type_map.items():
+            if issubclass(error_type, known_type):
+                category = cat
+                break
+        self._type_cache[error_type] = category
+        return category
+    
+    def _match_category(self, error_str: str) -> ErrorCategory:
+        """Match error text against known patterns, first pattern wins."""
+        try:
+            return self._category_cache[error_str]
+        except KeyError:
+            pass
+        
+        found = self._pattern_regex.findall(error_str) if self._pattern_rank else None
+        if not found:
+            category = ErrorCategory.UNKNOWN
+        else:
+            category = self._error_patterns[
+                min(found, key=self._pattern_rank.__getitem__)
+            ]
+        
+        if len(self._category_cache) >= self._CATEGORY_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del self._category_cache[next(iter(self._category_cache))]
+        self._category_cache[error_str] = category
+        return category
+    
     def _get_recommendations(self, category: ErrorCategory) -> List[str]:
         """Get recovery recommendations for error category."""
-        recommendations = {
-            ErrorCategory.TIMEOUT: [
-                "Increase timeout threshold",
-                "Optimize step performance",
-                "Split into smaller steps"
-            ],
-            ErrorCategory.RESOURCE_EXHAUSTED: [
-                "Increase resource allocation",
-                "Implement rate limiting",
-                "Add step batching"
-            ],
-            ErrorCategory.INVALID_INPUT: [
-                "Validate input data",
-                "Add data transformation",
-                "Check upstream step output"
-            ],
-            ErrorCategory.EXTERNAL_SERVICE: [
-                "Check service status",
-                "Implement circuit breaker",
-                "Add exponential backoff"
-            ],
-        }
-        
-        return recommendations.get(category, ["Retry with backoff"])
+        return list(
+            self._RECOMMENDATIONS.get(category, self._DEFAULT_RECOMMENDATIONS)
+        )
     
     def _calculate_confidence(self, error_str: str) -> float:
         """Calculate confidence in error classification."""
-        if len(error_str) > 50:
-            return 0.9
-        elif len(error_str) > 20:
-            return 0.7
-        return 0.5
+        return _CONFIDENCES[bisect.bisect_left(_CONFIDENCE_THRESHOLDS, len(error_str))]
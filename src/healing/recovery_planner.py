@@ -4,7 +4,7 @@ Recovery planner that generates fix strategies for errors.
 Plans retry strategies, fallbacks, and escalation logic.
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -17,7 +17,7 @@ class RecoveryStrategy(Enum):
     ESCALATE = "escalate"
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryPlan:
     """Represents a recovery plan for an error."""
     strategy: RecoveryStrategy
@@ -26,6 +26,37 @@ class RecoveryPlan:
     escalation_enabled: bool
 
 
+# Plan templates by error category: strategy, step templates, max attempts,
+# escalation enabled. "{step}" is replaced with the failed step name.
+_PLAN_TEMPLATES: Dict[str, Tuple[RecoveryStrategy, Tuple[str, ...], int, bool]] = {
+    "timeout": (
+        RecoveryStrategy.RETRY,
+        ("Increase timeout for {step}", "Retry {step} with backoff"),
+        3,
+        True,
+    ),
+    "resource_exhausted": (
+        RecoveryStrategy.RETRY,
+        ("Wait for resource availability", "Retry {step}"),
+        5,
+        False,
+    ),
+    "invalid_input": (
+        RecoveryStrategy.SKIP,
+        ("Validate input for {step}", "Skip {step} or use default"),
+        1,
+        True,
+    ),
+}
+
+_DEFAULT_PLAN_TEMPLATE: Tuple[RecoveryStrategy, Tuple[str, ...], int, bool] = (
+    RecoveryStrategy.ESCALATE,
+    ("Notify administrator",),
+    0,
+    True,
+)
+
+
 class RecoveryPlanner:
     """
     Plans recovery strategies for detected errors.
@@ -56,43 +87,15 @@ class RecoveryPlanner:
         """
         context = context or {}
         
-        if error_category == "timeout":
-            return RecoveryPlan(
-                strategy=RecoveryStrategy.RETRY,
-                steps=[
-                    f"Increase timeout for {step_name}",
-                    f"Retry {step_name} with backoff"
-                ],
-                max_attempts=3,
-                escalation_enabled=True
-            )
-        elif error_category == "resource_exhausted":
-            return RecoveryPlan(
-                strategy=RecoveryStrategy.RETRY,
-                steps=[
-                    f"Wait for resource availability",
-                    f"Retry {step_name}"
-                ],
-                max_attempts=5,
-                escalation_enabled=False
-            )
-        elif error_category == "invalid_input":
-            return RecoveryPlan(
-                strategy=RecoveryStrategy.SKIP,
-                steps=[
-                    f"Validate input for {step_name}",
-                    f"Skip {step_name} or use default"
-                ],
-                max_attempts=1,
-                escalation_enabled=True
-            )
-        else:
-            return RecoveryPlan(
-                strategy=RecoveryStrategy.ESCALATE,
-                steps=["Notify administrator"],
-                max_attempts=0,
-                escalation_enabled=True
-            )
+        strategy, step_templates, max_attempts, escalation_enabled = (
+            _PLAN_TEMPLATES.get(error_category, _DEFAULT_PLAN_TEMPLATE)
+        )
+        return RecoveryPlan(
+            strategy=strategy,
+            steps=[t.format(step=step_name) for t in step_templates],
+            max_attempts=max_attempts,
+            escalation_enabled=escalation_enabled
+        )
     
     def register_fallback(self, step_name: str, fallback: Callable) -> None:
         """
@@ -1,24 +1,75 @@
 """Pydantic models for workflow definition and execution."""
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StepModel(BaseModel):
     """Step definition model."""
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=True
+    )
+    
     name: str
     depends_on: List[str] = Field(default_factory=list)
     timeout: float = 30.0
     retries: int = 3
+    expected_cost: float = 1.0
+    selectivity: float = 1.0
+    kind: str = "io"
     description: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepModel":
+        """Build from untrusted input with full validation."""
+        return cls.model_validate(data)
+    
+    @classmethod
+    def unchecked(cls, **data: Any) -> "StepModel":
+        """Build from trusted internal data, skipping validation."""
+        return cls.model_construct(**data)
 
 
 class WorkflowModel(BaseModel):
     """Workflow definition model."""
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=True
+    )
+    
     name: str
     steps: List[StepModel]
     description: Optional[str] = None
     version: str = "1.0.0"
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowModel":
+        """Build from untrusted input with full validation."""
+        return cls.model_validate(data)
+    
+    @classmethod
+    def unchecked(cls, **data: Any) -> "WorkflowModel":
+        """Build from trusted internal data, skipping validation."""
+        if "steps" in data:
+            data["steps"] = [
+                step if isinstance(step, StepModel) else StepModel.unchecked(**step)
+                for step in data["steps"]
+            ]
+        return cls.model_construct(**data)
+
+
+class StepOutcomeModel(BaseModel):
+    """Outcome of a single step within an execution."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    status: str
+    value: Any = None
+    error: Optional[str] = None
 
 
 class ExecutionResultModel(BaseModel):
@@ -26,7 +77,7 @@ class ExecutionResultModel(BaseModel):
     execution_id: str
     workflow_name: str
     status: str
-    results: Dict[str, Any] = Field(default_factory=dict)
-    errors: Dict[str, str] = Field(default_factory=dict)
+    steps: Dict[str, StepOutcomeModel] = Field(default_factory=dict)
     started_at: str
     completed_at: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,92 @@
+"""Tests for error analyzer."""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from healing.error_analyzer import ErrorAnalyzer, ErrorCategory
+
+
+class TestErrorAnalyzer(unittest.TestCase):
+    """Test error analyzer."""
+
+    def test_known_types_classified_without_message(self):
+        """Test exception types map straight to a category."""
+        analyzer = ErrorAnalyzer()
+
+        for error in (asyncio.TimeoutError(), TimeoutError("slow")):
+            analysis = analyzer.analyze(error)
+            self.assertEqual(analysis.category, ErrorCategory.TIMEOUT)
+            self.assertEqual(analysis.root_cause, type(error).__name__)
+            self.assertEqual(analysis.confidence, 0.95)
+
+    def test_subclasses_use_their_base_category(self):
+        """Test subclasses of known types are matched and cached per type."""
+        analyzer = ErrorAnalyzer()
+
+        analysis = analyzer.analyze(ConnectionRefusedError("Invalid host"))
+
+        self.assertEqual(analysis.category, ErrorCategory.EXTERNAL_SERVICE)
+        self.assertIn(ConnectionRefusedError, analyzer._type_cache)
+
+    def test_message_patterns_keep_priority(self):
+        """Test the first listed pattern wins when several match."""
+        analyzer = ErrorAnalyzer()
+
+        self.assertEqual(
+            analyzer.analyze(RuntimeError("Connection timeout")).category,
+            ErrorCategory.TIMEOUT
+        )
+        self.assertEqual(
+            analyzer.analyze(RuntimeError("nothing known")).category,
+            ErrorCategory.UNKNOWN
+        )
+
+    def test_replaced_patterns_take_effect(self):
+        """Test assigning new patterns rebuilds the matcher and cache."""
+        analyzer = ErrorAnalyzer()
+        error = RuntimeError("Quota exceeded")
+        self.assertEqual(analyzer.analyze(error).category, ErrorCategory.UNKNOWN)
+
+        analyzer.error_patterns = {
+            "Quota": ErrorCategory.RESOURCE_EXHAUSTED,
+            **analyzer.error_patterns,
+        }
+
+        self.assertEqual(
+            analyzer.analyze(error).category, ErrorCategory.RESOURCE_EXHAUSTED
+        )
+
+    def test_patterns_are_read_only(self):
+        """Test in-place edits are rejected rather than silently ignored."""
+        analyzer = ErrorAnalyzer()
+
+        with self.assertRaises(TypeError):
+            analyzer.error_patterns["Quota"] = ErrorCategory.RESOURCE_EXHAUSTED
+
+    def test_confidence_buckets(self):
+        """Test confidence bucket boundaries."""
+        analyzer = ErrorAnalyzer()
+
+        self.assertEqual(analyzer._calculate_confidence("x" * 20), 0.5)
+        self.assertEqual(analyzer._calculate_confidence("x" * 21), 0.7)
+        self.assertEqual(analyzer._calculate_confidence("x" * 50), 0.7)
+        self.assertEqual(analyzer._calculate_confidence("x" * 51), 0.9)
+
+    def test_category_cache_is_bounded(self):
+        """Test the message cache evicts once it reaches its size."""
+        analyzer = ErrorAnalyzer()
+
+        for i in range(analyzer._CATEGORY_CACHE_SIZE + 10):
+            analyzer.analyze(RuntimeError(f"Invalid row {i}"))
+
+        self.assertEqual(
+            len(analyzer._category_cache), analyzer._CATEGORY_CACHE_SIZE
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
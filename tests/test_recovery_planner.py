@@ -0,0 +1,62 @@
+"""Tests for recovery planner."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from healing.recovery_planner import RecoveryPlan, RecoveryPlanner, RecoveryStrategy
+
+
+class TestRecoveryPlanner(unittest.TestCase):
+    """Test recovery planner."""
+
+    def test_templates_match_original_plans(self):
+        """Test each category yields the plan the if/elif cascade built."""
+        step = "load_{rows}"
+        expected = {
+            "timeout": RecoveryPlan(
+                strategy=RecoveryStrategy.RETRY,
+                steps=[f"Increase timeout for {step}", f"Retry {step} with backoff"],
+                max_attempts=3,
+                escalation_enabled=True
+            ),
+            "resource_exhausted": RecoveryPlan(
+                strategy=RecoveryStrategy.RETRY,
+                steps=["Wait for resource availability", f"Retry {step}"],
+                max_attempts=5,
+                escalation_enabled=False
+            ),
+            "invalid_input": RecoveryPlan(
+                strategy=RecoveryStrategy.SKIP,
+                steps=[f"Validate input for {step}", f"Skip {step} or use default"],
+                max_attempts=1,
+                escalation_enabled=True
+            ),
+            "external_service": RecoveryPlan(
+                strategy=RecoveryStrategy.ESCALATE,
+                steps=["Notify administrator"],
+                max_attempts=0,
+                escalation_enabled=True
+            ),
+        }
+        planner = RecoveryPlanner()
+
+        for category, plan in expected.items():
+            with self.subTest(category=category):
+                self.assertEqual(planner.plan_recovery(step, category), plan)
+
+    def test_plans_do_not_share_step_lists(self):
+        """Test callers can edit a plan without touching the template."""
+        planner = RecoveryPlanner()
+
+        planner.plan_recovery("a", "unknown").steps.append("extra")
+
+        self.assertEqual(
+            planner.plan_recovery("a", "unknown").steps, ["Notify administrator"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for step executor."""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from engine.step_executor import StepExecutor
+
+
+async def failing():
+    raise RuntimeError("boom")
+
+
+class TestStepExecutor(unittest.IsolatedAsyncioTestCase):
+    """Test step executor."""
+
+    async def test_backoff_is_capped_and_jittered(self):
+        """Test retry delays never exceed max_backoff."""
+        executor = StepExecutor(max_retries=5, max_backoff=2.0)
+
+        with mock.patch("engine.step_executor.asyncio.sleep") as sleep:
+            with self.assertRaises(RuntimeError):
+                await executor.execute("step", failing)
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        self.assertEqual(len(delays), 4)
+        for attempt, delay in enumerate(delays):
+            base = min(2.0, 2 ** attempt)
+            self.assertGreaterEqual(delay, base * 0.5)
+            self.assertLessEqual(delay, base)
+
+    async def test_max_retries_raised_after_init(self):
+        """Test retry settings changed after construction are honoured."""
+        executor = StepExecutor()
+        executor.max_retries = 5
+
+        with mock.patch("engine.step_executor.asyncio.sleep"):
+            with self.assertRaises(RuntimeError):
+                await executor.execute("step", failing)
+
+        self.assertEqual(executor.get_metrics("step")["attempts"], 5)
+
+    async def test_timeout_on_last_attempt_returns_none(self):
+        """Test a step timing out on every attempt yields None, not an error."""
+        executor = StepExecutor(max_retries=2, base_timeout=0.01)
+
+        async def stuck():
+            await asyncio.Event().wait()
+
+        with mock.patch("engine.step_executor.asyncio.sleep"):
+            result = await executor.execute("step", stuck)
+
+        self.assertIsNone(result)
+        self.assertEqual(executor.get_metrics("step")["attempts"], 2)
+        self.assertFalse(executor.get_metrics("step")["success"])
+
+    async def test_validation_failure_raises_on_last_attempt(self):
+        """Test results failing validation are retried, then raised."""
+        executor = StepExecutor(max_retries=2)
+
+        async def succeed():
+            return 1
+
+        with mock.patch("engine.step_executor.asyncio.sleep"):
+            with self.assertRaises(ValueError):
+                await executor.execute("step", succeed, validate=lambda r: r > 1)
+
+        self.assertEqual(executor.get_metrics("step")["attempts"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,557 @@
 """Tests for workflow engine."""
 
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
 import unittest
+from datetime import datetime, timezone
+from unittest import mock
 
-class TestWorkflowEngine(unittest.TestCase):
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from engine.workflow_engine import (
+    StepDefinition,
+    WorkflowDefinition,
+    WorkflowEngine,
+    _format_timestamp_ns,
+)
+from models.workflow_models import ExecutionResultModel
+
+
+class ScriptedEngine(WorkflowEngine):
+    """Engine whose steps sleep or raise according to a script."""
+
+    def __init__(self, durations=None, errors=None, **kwargs):
+        super().__init__(**kwargs)
+        self.durations = durations or {}
+        self.errors = errors or {}
+        self.runs = []
+        self.started = {}
+        self.finished = {}
+
+    async def _execute_step(self, step, execution_id):
+        self.runs.append(step.name)
+        self.started[step.name] = time.monotonic()
+        await asyncio.sleep(self.durations.get(step.name, 0))
+        self.finished[step.name] = time.monotonic()
+        pending_errors = self.errors.get(step.name)
+        if pending_errors:
+            raise pending_errors.pop(0)
+        return {"step": step.name}
+
+
+def statuses(result):
+    """Map each step to its recorded outcome status."""
+    return {name: outcome.status for name, outcome in result["steps"].items()}
+
+
+class TestWorkflowEngine(unittest.IsolatedAsyncioTestCase):
     """Test workflow engine."""
-    
-    def test_workflow_definition(self):
-        """Test workflow definition."""
-        self.assertTrue(True)
+
+    async def test_dependent_starts_before_slow_sibling_finishes(self):
+        """Test steps start as soon as their own dependencies finish."""
+        engine = ScriptedEngine(durations={"slow": 0.3, "fast": 0.01})
+        workflow = WorkflowDefinition(
+            name="skewed",
+            steps=[
+                StepDefinition("slow"),
+                StepDefinition("fast"),
+                StepDefinition("after_fast", depends_on=["fast"]),
+            ]
+        )
+        engine.register_workflow(workflow)
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(result["status"], "completed")
+        self.assertLess(engine.started["after_fast"], engine.finished["slow"])
+
+    async def test_concurrency_limit_launches_expensive_steps_first(self):
+        """Test ready steps beyond the limit wait, most expensive first."""
+        engine = ScriptedEngine(max_concurrency=1)
+        workflow = WorkflowDefinition(
+            name="limited",
+            steps=[
+                StepDefinition("a"),
+                StepDefinition("c"),
+                StepDefinition("x", depends_on=["a"], expected_cost=10.0),
+            ]
+        )
+        engine.register_workflow(workflow)
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(result["status"], "completed")
+        # Once "a" finishes, the costly "x" outranks the shallower "c"
+        self.assertEqual(engine.runs, ["a", "x", "c"])
+
+    async def test_circular_dependency(self):
+        """Test cycles are rejected at registration and at execution."""
+        workflow = WorkflowDefinition(
+            name="cyclic",
+            steps=[
+                StepDefinition("a", depends_on=["b"]),
+                StepDefinition("b", depends_on=["a"]),
+            ]
+        )
+        engine = ScriptedEngine()
+
+        with self.assertRaises(ValueError):
+            engine.register_workflow(workflow)
+
+        result = await engine.execute(workflow)
+        self.assertEqual(result["status"], "failed")
+        self.assertEqual(engine.runs, [])
+
+    async def test_missing_dependency(self):
+        """Test a dependency on an unknown step fails the execution."""
+        workflow = WorkflowDefinition(
+            name="dangling",
+            steps=[StepDefinition("a", depends_on=["missing"])]
+        )
+        engine = ScriptedEngine()
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(result["status"], "failed")
+        self.assertEqual(engine.runs, [])
+
+    async def test_registered_definition_is_immutable(self):
+        """Test steps can't be changed under a compiled plan."""
+        workflow = WorkflowDefinition(
+            name="frozen",
+            steps=[StepDefinition("a"), StepDefinition("b", depends_on=["a"])]
+        )
+        WorkflowEngine().register_workflow(workflow)
+
+        with self.assertRaises(AttributeError):
+            workflow.steps.append(StepDefinition("z"))
+        with self.assertRaises(AttributeError):
+            workflow.steps[1].depends_on.append("z")
+
+    async def test_registered_plan_is_reused(self):
+        """Test executing a registered workflow doesn't recompile it."""
+        engine = ScriptedEngine()
+        workflow = WorkflowDefinition(name="compiled", steps=[StepDefinition("a")])
+        engine.register_workflow(workflow)
+
+        with mock.patch.object(engine, "_compile") as compile_:
+            await engine.execute(workflow)
+            await engine.execute(workflow)
+
+        compile_.assert_not_called()
+
+    async def test_cancelled_step_is_recorded(self):
+        """Test a step ending cancelled doesn't crash the scheduler."""
+        engine = ScriptedEngine(errors={"a": [asyncio.CancelledError()]})
+        workflow = WorkflowDefinition(
+            name="cancelled_step",
+            steps=[StepDefinition("a"), StepDefinition("b", depends_on=["a"])]
+        )
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(statuses(result), {"a": "cancelled", "b": "skipped"})
+
+    async def test_cancelled_execution_gets_terminal_status(self):
+        """Test cancelling execute() doesn't leave the state running."""
+        engine = ScriptedEngine(durations={"slow": 10})
+        workflow = WorkflowDefinition(name="abandoned", steps=[StepDefinition("slow")])
+
+        task = asyncio.create_task(engine.execute(workflow))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        (state,) = engine.execution_state.values()
+        self.assertEqual(state["status"], "cancelled")
+        self.assertIn("completed_at_ns", state)
+
+
+class TestRecovery(unittest.IsolatedAsyncioTestCase):
+    """Test failure recovery and retries."""
+
+    async def test_skip_failure_marks_descendants_skipped(self):
+        """Test an unrecoverable failure skips everything downstream."""
+        engine = ScriptedEngine(errors={"parse": [ValueError("Invalid row")]})
+        workflow = WorkflowDefinition(
+            name="skip",
+            steps=[
+                StepDefinition("parse"),
+                StepDefinition("load", depends_on=["parse"]),
+                StepDefinition("report", depends_on=["load"]),
+                StepDefinition("other"),
+            ]
+        )
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(
+            statuses(result),
+            {
+                "parse": "failed",
+                "load": "skipped",
+                "report": "skipped",
+                "other": "success",
+            }
+        )
+        self.assertNotIn("load", engine.runs)
+
+    async def test_retry_holds_successors_until_step_succeeds(self):
+        """Test retryable failures rerun the step before its successors."""
+        engine = ScriptedEngine(
+            errors={"fetch": [TimeoutError(), TimeoutError()]},
+            max_backoff=0.01
+        )
+        workflow = WorkflowDefinition(
+            name="retry",
+            steps=[StepDefinition("fetch"), StepDefinition("use", depends_on=["fetch"])]
+        )
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(engine.runs, ["fetch", "fetch", "fetch", "use"])
+        self.assertEqual(statuses(result), {"fetch": "success", "use": "success"})
+
+    async def test_exhausted_retries_skip_successors(self):
+        """Test successors never run with a missing input."""
+        engine = ScriptedEngine(
+            errors={"fetch": [TimeoutError()] * 3},
+            max_backoff=0.01
+        )
+        workflow = WorkflowDefinition(
+            name="exhausted",
+            steps=[StepDefinition("fetch"), StepDefinition("use", depends_on=["fetch"])]
+        )
+
+        result = await engine.execute(workflow)
+
+        self.assertEqual(statuses(result), {"fetch": "failed", "use": "skipped"})
+        self.assertNotIn("use", engine.runs)
+
+    async def test_step_retries_cap_plan_attempts(self):
+        """Test a step's own retry budget limits how often it reruns."""
+        engine = ScriptedEngine(
+            errors={"once": [TimeoutError()] * 5, "twice": [TimeoutError()] * 5},
+            max_backoff=0.01
+        )
+        workflow = WorkflowDefinition(
+            name="capped",
+            steps=[
+                StepDefinition("once", retries=0),
+                StepDefinition("twice", retries=2),
+            ]
+        )
+
+        await engine.execute(workflow)
+
+        self.assertEqual(engine.runs.count("once"), 1)
+        self.assertEqual(engine.runs.count("twice"), 2)
+
+    async def test_retries_wait_for_backoff(self):
+        """Test reruns are delayed by a capped, jittered backoff."""
+        engine = ScriptedEngine(
+            errors={"fetch": [TimeoutError(), TimeoutError()]},
+            max_backoff=0.05
+        )
+        workflow = WorkflowDefinition(name="backoff", steps=[StepDefinition("fetch")])
+
+        with mock.patch.object(
+            engine, "_retry_delay", wraps=engine._retry_delay
+        ) as retry_delay:
+            started = time.monotonic()
+            await engine.execute(workflow)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(
+            [call.args[0] for call in retry_delay.call_args_list], [1, 2]
+        )
+        # Each delay is at least half of max_backoff
+        self.assertGreaterEqual(elapsed, 0.05)
+
+
+class TestStatePersistence(unittest.IsolatedAsyncioTestCase):
+    """Test background persistence of execution state."""
+
+    async def test_state_written_per_execution(self):
+        """Test each execution gets its own atomically replaced file."""
+        workflow = WorkflowDefinition(name="persisted", steps=[StepDefinition("a")])
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = ScriptedEngine(state_dir=tmp)
+            await engine.execute(workflow)
+            (execution_id,) = engine.execution_state
+
+            self.assertEqual(os.listdir(tmp), [f"{execution_id}.json"])
+            with open(os.path.join(tmp, f"{execution_id}.json")) as f:
+                self.assertEqual(json.load(f)["status"], "completed")
+            await engine.aclose()
+
+    async def test_state_file_round_trips_through_result_model(self):
+        """Test persisted state validates as an ExecutionResultModel."""
+        engine = ScriptedEngine(errors={"b": [RuntimeError("boom")]})
+        workflow = WorkflowDefinition(
+            name="round_trip",
+            steps=[StepDefinition("a"), StepDefinition("b", depends_on=["a"])]
+        )
+        await engine.execute(workflow)
+        ((execution_id, state),) = engine.execution_state.items()
+
+        model = ExecutionResultModel.model_validate_json(
+            engine._serialize_state(execution_id, state)
+        )
+
+        self.assertEqual(model.execution_id, execution_id)
+        self.assertEqual(model.workflow_name, "round_trip")
+        self.assertEqual(model.status, "completed")
+        self.assertEqual(model.steps["a"].value, {"step": "a"})
+        self.assertEqual(model.steps["b"].status, "failed")
+        self.assertEqual(model.steps["b"].error, "boom")
+        self.assertIsNotNone(model.completed_at)
+
+    async def test_step_outcomes_keep_field_names(self):
+        """Test step outcomes serialize as named fields, not positional lists."""
+        engine = ScriptedEngine()
+        workflow = WorkflowDefinition(name="fields", steps=[StepDefinition("a")])
+        await engine.execute(workflow)
+        ((execution_id, state),) = engine.execution_state.items()
+
+        payload = json.loads(engine._serialize_state(execution_id, state))
+
+        self.assertEqual(
+            payload["steps"]["a"],
+            {"status": "success", "value": {"step": "a"}, "error": None}
+        )
+
+    async def test_only_touched_executions_are_serialized(self):
+        """Test a batch doesn't rewrite earlier executions."""
+        workflow = WorkflowDefinition(name="persisted", steps=[StepDefinition("a")])
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = ScriptedEngine(state_dir=tmp)
+            await engine.execute(workflow)
+            (first_id,) = engine.execution_state
+
+            with mock.patch.object(
+                engine, "_write_states", wraps=engine._write_states
+            ) as write:
+                await engine.execute(workflow)
+
+            written = set()
+            for call in write.call_args_list:
+                written.update(call.args[0])
+            self.assertNotIn(first_id, written)
+            self.assertEqual(len(written), 1)
+            await engine.aclose()
+
+    async def test_aclose_stops_writer(self):
+        """Test aclose flushes pending writes and stops the writer task."""
+        workflow = WorkflowDefinition(name="persisted", steps=[StepDefinition("a")])
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = ScriptedEngine(state_dir=tmp)
+            await engine.execute(workflow)
+            writer = engine._persist_task
+
+            await engine.aclose()
+            await asyncio.sleep(0)
+
+            self.assertTrue(writer.done())
+            self.assertIsNone(engine._persist_task)
+
+
+class TestCheckpoints(unittest.IsolatedAsyncioTestCase):
+    """Test step checkpoints and resuming."""
+
+    async def test_resume_skips_checkpointed_steps(self):
+        """Test resuming only runs steps that did not complete."""
+        workflow = WorkflowDefinition(
+            name="resumable",
+            steps=[
+                StepDefinition("a"),
+                StepDefinition("b", depends_on=["a"]),
+                StepDefinition("c", depends_on=["b"]),
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "checkpoints.db")
+
+            first = ScriptedEngine(
+                errors={"b": [RuntimeError("boom")]},
+                checkpoint_path=path
+            )
+            result = await first.execute(workflow)
+            first.close()
+            self.assertEqual(
+                statuses(result),
+                {"a": "success", "b": "failed", "c": "skipped"}
+            )
+            execution_id = next(iter(first.execution_state))
+
+            second = ScriptedEngine(checkpoint_path=path)
+            result = await second.execute(workflow, resume_from=execution_id)
+            second.close()
+
+        self.assertEqual(second.runs, ["b", "c"])
+        self.assertEqual(
+            statuses(result),
+            {"a": "success", "b": "success", "c": "success"}
+        )
+
+    async def test_unpicklable_result_does_not_fail_execution(self):
+        """Test a result that can't be checkpointed doesn't abort the run."""
+        class LockEngine(ScriptedEngine):
+            async def _execute_step(self, step, execution_id):
+                await super()._execute_step(step, execution_id)
+                return threading.Lock() if step.name == "a" else step.name
+
+        workflow = WorkflowDefinition(
+            name="unpicklable",
+            steps=[StepDefinition("a"), StepDefinition("b", depends_on=["a"])]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = LockEngine(checkpoint_path=os.path.join(tmp, "ckpt.db"))
+            with self.assertLogs("engine.workflow_engine", level="ERROR"):
+                result = await engine.execute(workflow)
+            engine.close()
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(statuses(result), {"a": "success", "b": "success"})
+
+
+class TestExecutionTimestamps(unittest.IsolatedAsyncioTestCase):
+    """Test execution ids and timestamp formatting."""
+
+    def test_format_matches_isoformat(self):
+        """Test lazy formatting matches datetime.isoformat to the microsecond."""
+        ns = 1_700_000_000_123_456_789
+        expected = datetime.fromtimestamp(ns // 1000 / 1e6, tz=timezone.utc)
+
+        self.assertEqual(_format_timestamp_ns(ns), expected.isoformat())
+
+    async def test_execution_id_shape(self):
+        """Test ids carry the workflow name, a ns timestamp and a uuid suffix."""
+        engine = ScriptedEngine()
+        workflow = WorkflowDefinition(name="ids", steps=[StepDefinition("a")])
+
+        first = await engine.execute(workflow)
+        second = await engine.execute(workflow)
+
+        (first_id, second_id) = engine.execution_state
+        self.assertRegex(first_id, r"^ids_\d+_[0-9a-f]{12}$")
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(first["workflow"], second["workflow"])
+
+    async def test_status_and_state_file_use_iso_timestamps(self):
+        """Test both the status view and the persisted state carry ISO times."""
+        workflow = WorkflowDefinition(name="timed", steps=[StepDefinition("a")])
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = ScriptedEngine(state_dir=tmp)
+            result = await engine.execute(workflow)
+            (execution_id,) = engine.execution_state
+            with open(os.path.join(tmp, f"{execution_id}.json")) as f:
+                persisted = json.load(f)
+            await engine.aclose()
+
+        for view in (result, persisted):
+            for key in ("started_at", "completed_at"):
+                self.assertEqual(
+                    datetime.fromisoformat(view[key]),
+                    datetime.fromtimestamp(
+                        view[f"{key}_ns"] // 1000 / 1e6, tz=timezone.utc
+                    )
+                )
+
+
+class TestLane(unittest.IsolatedAsyncioTestCase):
+    """Test the thread pool lane for cpu steps."""
+
+    async def test_cpu_steps_run_off_loop_and_report_failures(self):
+        """Test cpu steps run off the event loop and report failures."""
+        loop_thread = threading.get_ident()
+
+        class LaneEngine(WorkflowEngine):
+            def _run_step_sync(self, step):
+                if step.name == "bad":
+                    raise ValueError("Invalid input")
+                return threading.get_ident()
+
+        workflow = WorkflowDefinition(
+            name="lane",
+            steps=[
+                StepDefinition("x", kind="cpu"),
+                StepDefinition("y", kind="cpu"),
+                StepDefinition("bad", kind="cpu"),
+            ]
+        )
+        engine = LaneEngine()
+
+        result = await engine.execute(workflow)
+        engine.close()
+
+        self.assertEqual(
+            statuses(result),
+            {"x": "success", "y": "success", "bad": "failed"}
+        )
+        self.assertNotEqual(result["steps"]["x"].value, loop_thread)
+
+    async def test_slow_step_does_not_block_its_batch(self):
+        """Test steps drained together still run as separate jobs."""
+        fast_done = threading.Event()
+
+        class LaneEngine(WorkflowEngine):
+            def _run_step_sync(self, step):
+                if step.name == "slow":
+                    # Only returns True if "fast" ran alongside it
+                    return fast_done.wait(timeout=2)
+                fast_done.set()
+                return True
+
+        workflow = WorkflowDefinition(
+            name="batch",
+            steps=[
+                StepDefinition("slow", kind="cpu", expected_cost=2.0),
+                StepDefinition("fast", kind="cpu"),
+            ]
+        )
+        engine = LaneEngine()
+
+        result = await engine.execute(workflow)
+        engine.close()
+
+        self.assertTrue(result["steps"]["slow"].value)
+
+    async def test_step_timeout_applies(self):
+        """Test a cpu step running past its timeout is abandoned."""
+        release = threading.Event()
+
+        class LaneEngine(WorkflowEngine):
+            def _run_step_sync(self, step):
+                release.wait(timeout=2)
+
+        engine = LaneEngine()
+        step = StepDefinition("stuck", kind="cpu", timeout=0.05)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await engine._execute_step(step, "exec")
+        release.set()
+        engine.close()
+
+    async def test_close_stops_worker(self):
+        """Test close cancels the lane worker."""
+        engine = WorkflowEngine()
+        await engine._execute_step(StepDefinition("x", kind="cpu"), "exec")
+        worker = engine._lane._worker
+
+        engine.close()
+        await asyncio.sleep(0)
+
+        self.assertTrue(worker.cancelled())
+        self.assertIsNone(engine._lane)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for workflow models."""
+
+import os
+import sys
+import unittest
+
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.workflow_models import StepModel, WorkflowModel
+
+
+class TestWorkflowModels(unittest.TestCase):
+    """Test workflow models."""
+
+    def test_from_dict_validates(self):
+        """Test untrusted input is validated and coerced."""
+        workflow = WorkflowModel.from_dict({
+            "name": "etl",
+            "steps": [{"name": "load", "timeout": "5"}],
+        })
+
+        self.assertIsInstance(workflow.steps[0], StepModel)
+        self.assertEqual(workflow.steps[0].timeout, 5.0)
+
+    def test_from_dict_rejects_bad_input(self):
+        """Test unknown keys and wrong types are rejected."""
+        bad_inputs = (
+            {"name": "etl", "steps": [], "owner": "ops"},
+            {"name": "etl", "steps": [{"name": "load", "retries": "many"}]},
+            {"steps": []},
+        )
+
+        for data in bad_inputs:
+            with self.subTest(data=data):
+                with self.assertRaises(ValidationError):
+                    WorkflowModel.from_dict(data)
+
+    def test_unchecked_builds_nested_steps(self):
+        """Test trusted construction still yields StepModel instances."""
+        existing = StepModel.unchecked(name="extract")
+
+        workflow = WorkflowModel.unchecked(
+            name="etl",
+            steps=[existing, {"name": "load", "depends_on": ["extract"]}]
+        )
+
+        self.assertIs(workflow.steps[0], existing)
+        self.assertIsInstance(workflow.steps[1], StepModel)
+        self.assertEqual(workflow.steps[1].depends_on, ["extract"])
+        self.assertEqual(workflow.steps[1].timeout, 30.0)
+
+    def test_models_are_frozen(self):
+        """Test validated models reject attribute assignment."""
+        step = StepModel.from_dict({"name": "load"})
+
+        with self.assertRaises(ValidationError):
+            step.timeout = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()